@@ -1,4 +1,5 @@
-import subprocess
+import glob
+import shutil
 from configparser import ConfigParser
 
 from setuptools import setup  # type: ignore
@@ -7,32 +8,32 @@ config = ConfigParser()
 config.read("setup.cfg")
 install_requires = config["options"]["install_requires"].splitlines()
 
+# Standard locations of the libsystemd pkg-config file (provided by libsystemd-dev)
+LIBSYSTEMD_PC_PATTERNS = [
+    "/usr/lib/pkgconfig/libsystemd.pc",
+    "/usr/lib/*/pkgconfig/libsystemd.pc",
+    "/usr/lib64/pkgconfig/libsystemd.pc",
+    "/usr/share/pkgconfig/libsystemd.pc",
+]
 
-def check_system_packages_installed(packages):
+
+def check_journald_build_deps():
     """
-    Check if system packages are installed using dpkg.
-    Args:
-        packages (list): List of system packages to check for.
+    Check if the build dependencies of systemd-python are available.
+    Looks for the executables and pkg-config file directly, rather than spawning
+    a `dpkg` subprocess on every build.
 
     Returns:
-        bool: True if all packages are installed, False otherwise.
+        bool: True if GCC, pkg-config and libsystemd headers are installed, False otherwise.
     """
-    if isinstance(packages, str):
-        packages = [packages]
-    cmd = ["dpkg", "-s"]
-    cmd.extend(packages)
-    try:
-        return not subprocess.run(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        ).returncode
-    except FileNotFoundError:
-        # dpkg not installed
+    if not (shutil.which("gcc") and shutil.which("pkg-config")):
         return False
+    return any(glob.glob(pattern) for pattern in LIBSYSTEMD_PC_PATTERNS)
 
 
 # If GCC, pkg-config and libsystemd-dev are installed, we can also install systemd-python,
 # which will enable journald logging
-if check_system_packages_installed(["gcc", "pkg-config", "libsystemd-dev"]):
+if check_journald_build_deps():
     install_requires.append("systemd-python")
 
 if __name__ == "__main__":
@@ -28,11 +28,15 @@ def _check_status_remote(host, services, show_logs):
             "show-logs is unused on remote hosts due to the requirement for elevated privileges."
         )
     handler = ShellHandler(host)
-    registered = [
-        el
-        for el in services
-        if not handler.execute(f"test -f {get_service_file(el)}").returncode
-    ]
+    # Check for all service files in a single round-trip. `if` is used rather than `&&`
+    # so that the command succeeds even when the last service file is missing.
+    result = handler.execute(
+        "; ".join(
+            f"if test -f {get_service_file(el)}; then echo {el}; fi" for el in services
+        )
+    )
+    found = set(result.stdout.split())
+    registered = [el for el in services if el in found]
     if len(registered) == 0:
         print(f"No `schedtools` services are registered with `systemd` on host {host}.")
         return
@@ -43,14 +47,15 @@ def _check_status_remote(host, services, show_logs):
     terminal_width, _ = shutil.get_terminal_size()
     print("_" * terminal_width)
     prefix = "sudo " if show_logs else ""
-    # Disable the default systemd pager to prevent hangs
-    handler.execute("export SYSTEMD_LESS=-FXR\n")
-    for service in registered:
-        handler.execute("echo")
-        result = handler.execute(f"systemctl status {service}.service")
-        for line in result.stdout:
-            print(line)
-        print("_" * terminal_width)
+    # Disable the default systemd pager inline to prevent hangs, saving a round-trip
+    result = handler.execute(
+        "SYSTEMD_PAGER=cat SYSTEMD_LESS=-FXR systemctl status "
+        + " ".join(f"{service}.service" for service in registered)
+    )
+    # `systemctl status` exits non-zero if any unit is inactive, in which case the
+    # handler reports the output as stderr.
+    print(result.stderr if result.returncode else result.stdout)
+    print("_" * terminal_width)
 
 
 def check_status():
@@ -1,52 +1,108 @@
 import argparse
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Union
 
 import regex as re  # We need expanded regex functionality for the `\K` (keep) regex char
 
+# Compiled once, so that recursive calls and per-file matching skip regex compilation.
+_PATTERNS = {
+    "pbs": re.compile(r".*\.pbs\.(e|o)\K\d+$"),
+    "slurm": re.compile(r"^\d+(?=\..*\.(out|err)$)"),
+}
+
+
+def _scan_directory(path: str, up_to: int, pattern: re.Pattern):
+    """Scan a single directory for cluster logs with job ids below `up_to`.
+
+    Returns:
+        Tuple of matching log paths and subdirectory paths.
+    """
+    found = []
+    subdirs = []
+    # `os.scandir` entries carry cached file type information, saving a `stat` per entry.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            match = pattern.match(entry.name)
+            if match is not None and int(match.group()) < up_to:
+                found.append(entry.path)
+    return found, subdirs
+
+
+def _find_cluster_logs(path: str, up_to: int, pattern: re.Pattern, recursive: int):
+    """Find cluster logs with job ids below `up_to`. See `clear_cluster_logs`.
+
+    Subdirectories are scanned concurrently, as the work is dominated by filesystem calls
+    which release the GIL.
+    """
+    found, subdirs = _scan_directory(path, up_to, pattern)
+    if not recursive:
+        return sorted(found)
+    with ThreadPoolExecutor() as executor:
+        # Map of pending scans to the recursion budget remaining below them
+        pending = {
+            executor.submit(_scan_directory, subdir, up_to, pattern): recursive - 1
+            for subdir in subdirs
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                remaining = pending.pop(future)
+                logs, subdirs = future.result()
+                found.extend(logs)
+                if remaining:
+                    for subdir in subdirs:
+                        future = executor.submit(
+                            _scan_directory, subdir, up_to, pattern
+                        )
+                        pending[future] = remaining - 1
+    # Scans complete in arbitrary order, so sort for a stable listing
+    return sorted(found)
+
 
 def clear_cluster_logs(
     path: str,
     up_to: int,
-    pattern: str = "pbs",
+    pattern: Union[str, re.Pattern] = "pbs",
     recursive: int = False,
     force: bool = False,
 ):
     """Clear old cluster logs (stdout and stderr streams captured by the batch management system).
 
+    Unless `force` is set, all matching logs are listed and the user is prompted once to remove
+    them all, none, or to select them individually.
+
     Args:
         path: Directory in which to clear cluster logs.
         up_to: Job id up to which to remove matching cluster logs (non-inclusive).
-        pattern: "pbs", "slurm", or arbitrary regex pattern. If regex is used, it must match the numeric job id of
-            the cluster logs. Defaults to "pbs".
+        pattern: "pbs", "slurm", or arbitrary regex pattern (string or compiled). If regex is used, it must match
+            the numeric job id of the cluster logs. Defaults to "pbs".
         recursive: Recurse into directories. Positive numbers specify a max recursion count. Pass a negative number
             to recurse down the entire tree. Defaults to False.
         force: Remove cluster logs without prompting for user confirmation. Defaults to False.
     """
     assert os.path.exists(path) and os.path.isdir(path), "`path` must be a directory"
-    if pattern == "pbs":
-        pattern = ".*\.pbs\.(e|o)\K\d+$"
-    elif pattern == "slurm":
-        pattern = "^\d+(?=\..*\.(out|err)$)"
-    for file in os.listdir(path):
-        filepath = os.path.join(path, file)
-        if os.path.isdir(filepath) and recursive:
-            clear_cluster_logs(
-                filepath,
-                up_to=up_to,
-                pattern=pattern,
-                recursive=recursive - 1,
-                force=force,
-            )
-        match = re.match(pattern, file)
-        if match is not None:
-            job_id = int(file[slice(*match.span())])
-            if job_id < up_to:
-                if force:
-                    do_remove = True
-                else:
-                    do_remove = input(f"Remove job file '{filepath}'? [y/N]: ") == "y"
-                if do_remove:
-                    os.remove(filepath)
+    if isinstance(pattern, str):
+        pattern = _PATTERNS.get(pattern) or re.compile(pattern)
+    to_remove = _find_cluster_logs(path, up_to, pattern, recursive)
+    if not len(to_remove):
+        return
+    if not force:
+        print("Found the following job files:\n" + "\n".join(to_remove))
+        response = input(f"Remove {len(to_remove)} job files? [y/N/select]: ")
+        if response == "select":
+            to_remove = [
+                filepath
+                for filepath in to_remove
+                if input(f"Remove job file '{filepath}'? [y/N]: ") == "y"
+            ]
+        elif response != "y":
+            return
+    for filepath in to_remove:
+        os.remove(filepath)
 
 
 def clear_logs():
@@ -13,8 +13,9 @@ def conversion_helper(path, recursive, to, updates={}):
         elif ext == ".sbatch" and to == "pbs":
             convert_to_pbs(path, base + ".pbs", updates=updates)
     elif os.path.isdir(path) and recursive:
-        for file in os.listdir(path):
-            conversion_helper(os.path.join(path, file), recursive=recursive, to=to)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                conversion_helper(entry.path, recursive=recursive, to=to)
 
 
 def convert_jobscripts():
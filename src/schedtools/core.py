@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Union
 
 from schedtools.utils import walltime_to
@@ -8,6 +9,18 @@ DEFAULT_PRIORITY = 0
 UNSUBMITTED_PRIORITY = -1
 
 
+# Parsing is cached on the raw field value, so repeated property access (and jobs
+# sharing a walltime) skip re-parsing, while edits to the job fields are still seen.
+@lru_cache(maxsize=1024)
+def _parse_walltime(walltime: str) -> timedelta:
+    return timedelta(seconds=walltime_to(walltime, "s"))
+
+
+@lru_cache(maxsize=1024)
+def _parse_time(time: str) -> datetime:
+    return datetime.strptime(time, "%a %b %d %H:%M:%S %Y")
+
+
 class PBSJob(dict):
     """Simple dict-like interface for storing PBS job information.
 
@@ -25,12 +38,17 @@ class PBSJob(dict):
         S="suspended",
         U="unsubmitted",  # This is an additional flag for jobs which are tracked but have not been submitted
     )
-    # TODO: Make into a proper dataclass if needed.
-    def __getattr__(self, key, *args, **kwargs):
+
+    # Jobs only hold their fields as dict items, so skip the per-instance `__dict__`.
+    __slots__ = ()
+
+    def __getattr__(self, key):
+        # Only called once regular attribute lookup has already failed, so go straight
+        # to the job fields.
         try:
-            return super().__getattribute__(key, *args, **kwargs)
-        except AttributeError:
-            return self.__getitem__(key, *args, **kwargs)
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
 
     @classmethod
     def unsubmitted(cls, jobscript_path):
@@ -72,19 +90,20 @@ class PBSJob(dict):
     def jobscript_path(self):
         if "jobscript_path" in self:
             return self["jobscript_path"]
-        return self["Submit_arguments"].replace("\n", "").split()[-1]
+        # Only the final argument is needed, so split once from the right
+        return self["Submit_arguments"].replace("\n", "").rsplit(None, 1)[-1]
 
     @property
     def error_path(self):
-        return self["Error_Path"].split(":")[-1]
+        return self["Error_Path"].rpartition(":")[2]
 
     @property
     def percent_completion(self):
         if "resources_used.walltime" in self:
             return (
                 100
-                * walltime_to(self["resources_used.walltime"])
-                / walltime_to(self["Resource_List.walltime"])
+                * walltime_to(self["resources_used.walltime"], "s")
+                / self.walltime.total_seconds()
             )
         return 0
 
@@ -102,20 +121,20 @@ class PBSJob(dict):
 
     @property
     def walltime(self):
-        hours, minutes, seconds = map(int, self["Resource_List.walltime"].split(":"))
-        return timedelta(hours=hours, minutes=minutes, seconds=seconds)
+        return _parse_walltime(self["Resource_List.walltime"])
 
     @property
     def start_time(self):
         if "stime" in self:
-            return datetime.strptime(self["stime"], "%a %b %d %H:%M:%S %Y")
+            return _parse_time(self["stime"])
         return None
 
     @property
     def end_time(self):
-        if self.start_time is None:
+        start_time = self.start_time
+        if start_time is None:
             return None
-        return self.start_time + self.walltime
+        return start_time + self.walltime
 
     @property
     def has_elapsed(self):
@@ -125,16 +144,20 @@ class PBSJob(dict):
 
 
 class Queue:
-    def __init__(self, jobs: List[PBSJob] = []):
-        self.jobs = {j.id: j for j in jobs if len(j)}
+    def __init__(self, jobs: Union[List[PBSJob], None] = None):
+        self.jobs = {j.id: j for j in jobs if len(j)} if jobs else {}
+        # Priority-sorted view of `jobs`, invalidated whenever the queue is modified.
+        self._sorted = None
 
     def pop(self, job: Union[str, PBSJob]):
         if isinstance(job, PBSJob):
             job = job.id
         self.jobs.pop(job)
+        self._sorted = None
 
     def append(self, job: PBSJob):
         self.jobs[job.id] = job
+        self._sorted = None
 
     def extend(self, jobs: List[PBSJob]):
         self.update({j.id: j for j in jobs})
@@ -143,19 +166,29 @@ class Queue:
         if isinstance(other, Queue):
             other = other.jobs
         self.jobs.update(other)
+        self._sorted = None
 
     def __iter__(self):
-        # Sort by priority when iterating
-        return iter(sorted(self.jobs.values(), key=lambda x: x.priority, reverse=True))
+        # Sort by priority when iterating, reusing the last sort until the queue changes
+        if self._sorted is None:
+            self._sorted = sorted(
+                self.jobs.values(), key=lambda x: x.priority, reverse=True
+            )
+        return iter(self._sorted)
+
+    def get(self, job: Union[str, PBSJob], default=None):
+        if isinstance(job, PBSJob):
+            job = job.id
+        return self.jobs.get(job, default)
 
     def __contains__(self, job):
         if isinstance(job, PBSJob):
             job = job.id
-        return job in self.jobs.keys()
+        return job in self.jobs
 
     def __len__(self):
         return len(self.jobs)
 
     def count(self, status):
         assert status in PBSJob.status_dict.values()
-        return len([job for job in self if job.status == status])
+        return sum(1 for job in self.jobs.values() if job.status == status)
@@ -4,7 +4,6 @@ import os
 from schedtools.jobs import delete_queued_duplicates
 from schedtools.log import loggers
 from schedtools.shell_handler import ShellHandler
-from schedtools.utils import connect_to_host
 
 
 def delete_duplicate_jobs():
@@ -35,10 +34,8 @@ def delete_duplicate_jobs():
     else:
         kwargs = {}
 
-    password = connect_to_host(args.host, True, **kwargs)
-    if password is not None:
-        kwargs["password"] = password
-
+    # The handler prompts for a password itself if needed, so connect only once rather
+    # than opening a separate connection just to check authentication.
     delete_queued_duplicates(
         ShellHandler(args.host, **kwargs),
         logger=loggers.current,
@@ -1,15 +1,19 @@
 import sys
 from pathlib import Path
 
-from rich.console import Console
-from rich.markdown import Markdown
-
-console = Console()
+README_PATH = Path(__file__).parent.parent.parent / "README.md"
 
 
 def help():
-    with open(Path(__file__).parent.parent.parent / "README.md", "r+") as help_file:
-        console.print(Markdown(help_file.read()))
+    from rich.console import Console
+    from rich.markdown import Markdown
+
+    console = Console()
+    if console.is_terminal:
+        console.print(Markdown(README_PATH.read_text()))
+    else:
+        # Nothing to render when piped or redirected, so skip Markdown parsing entirely
+        sys.stdout.buffer.write(README_PATH.read_bytes())
     sys.exit(0)
 
 
@@ -111,20 +111,20 @@ def delete_queued_duplicates(
     if manager is None:
         manager = get_workload_manager(handler, logger or loggers.current)
     jobs = manager.get_jobs()
-    waiting_scripts = []
+    waiting_scripts = set()
     duplicates = Queue()
     for job in jobs:
         if not count_running and not job.is_queued:
             continue
-        if job.jobscript_path in waiting_scripts:
+        jobscript_path = job.jobscript_path
+        if jobscript_path in waiting_scripts:
             duplicates.append(job)
         else:
-            waiting_scripts.append(job.jobscript_path)
-    for job in duplicates:
-        try:
-            manager.delete_job(job)
-        except JobDeletionError:
-            pass
+            waiting_scripts.add(jobscript_path)
+    try:
+        manager.delete_jobs(list(duplicates))
+    except JobDeletionError:
+        pass
 
 
 def rerun_jobs(
@@ -158,9 +158,11 @@ def rerun_jobs(
         tracked = get_tracked_from_cluster(handler)
 
         tracked.update(get_tracked_cache())
-        to_rerun = Queue(
-            [job for job in tracked if (job not in queued) and manager.was_killed(job)]
-        )
+        # Each kill check reads the job's error log remotely, so only check each job once
+        killed = {
+            job.id: manager.was_killed(job) for job in tracked if job not in queued
+        }
+        to_rerun = Queue([job for job in tracked if killed.get(job.id, False)])
         to_rerun.extend([job for job in queued if job.percent_completion >= threshold])
         # Remove completed jobs that no longer appear in the queue AND were not killed AND
         # were running at last register AND for which the entire runtime has elapsed.
@@ -171,7 +173,7 @@ def rerun_jobs(
                 if (job not in queued)
                 and job.is_running
                 and job.has_elapsed
-                and not manager.was_killed(job)
+                and not killed[job.id]
             ]
         )
         for job in completed:
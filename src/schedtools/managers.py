@@ -2,7 +2,7 @@ import re
 from abc import ABC, abstractmethod, abstractstaticmethod
 from functools import partialmethod
 from logging import Logger
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from schedtools.core import PBSJob, Queue
 from schedtools.exceptions import (
@@ -76,13 +76,20 @@ class WorkloadManager(ABC):
             track_new_jobs(self.handler, job, logger=self.logger)
 
     def delete_job(self, job: Union[str, PBSJob]):
-        if isinstance(job, str):
-            job_id = job
-        else:
-            job_id = job.id
-        result = self.handler.execute(f"{self.delete_cmd} {job_id}")
+        self.delete_jobs([job])
+
+    def delete_jobs(self, jobs: List[Union[str, PBSJob]]):
+        """Delete multiple jobs with a single scheduler command.
+
+        The scheduler attempts to delete every job even if some deletions fail, in
+        which case a single `JobDeletionError` is raised.
+        """
+        job_ids = [job if isinstance(job, str) else job.id for job in jobs]
+        if not len(job_ids):
+            return
+        result = self.handler.execute(f"{self.delete_cmd} {' '.join(job_ids)}")
         if result.returncode:
-            msg = f"Deletion of job {job_id} failed with status {result.returncode} ({result.stderr.strip()})"
+            msg = f"Deletion of jobs {', '.join(job_ids)} failed with status {result.returncode} ({result.stderr.strip()})"
             self.logger.info(msg)
             raise JobDeletionError(msg)
 
@@ -180,7 +187,8 @@ class PBS(WorkloadManager):
                     current_job[current_key] += line.strip()
                     current_indent = indent
                 else:
-                    key, val = line.strip().split(" = ")
+                    # Partition on the first separator only; values may contain " = "
+                    key, _, val = line.strip().partition(" = ")
                     current_job[key] = val
                     current_key = key
                     current_indent = 0
@@ -223,17 +231,22 @@ class PBS(WorkloadManager):
         else:
             self.logger.info(f"Rerunning job {job.id} ({job.name})")
 
-    def was_killed_reason(self, job: PBSJob, reason):
+    def was_killed_reason(self, job: PBSJob, reason: Union[str, Tuple[str, ...]]):
+        """Check whether a job was killed for `reason`, or any of several reasons.
+
+        The job's error log is read once, however many reasons are checked.
+        """
+        if isinstance(reason, str):
+            reason = (reason,)
         result = self.handler.execute(f"tail {job.error_path}")
         if result.returncode:
             # TODO: Make more robust
             return False
-        if f"PBS: job killed: {reason}" in result.stdout:
-            return True
-        return False
+        return any(f"PBS: job killed: {el}" in result.stdout for el in reason)
 
     was_killed_mem = partialmethod(was_killed_reason, reason="mem")
     was_killed_walltime = partialmethod(was_killed_reason, reason="walltime")
+    was_killed = partialmethod(was_killed_reason, reason=("walltime", "mem"))
 
 
 class SLURM(WorkloadManager):
@@ -5,8 +5,6 @@ import subprocess
 import tempfile
 import uuid
 
-import pandas as pd
-
 from schedtools.managers import get_workload_manager
 from schedtools.shell_handler import ShellHandler
 from schedtools.utils import connect_to_host
@@ -31,6 +29,8 @@ def queue_status():
 
     args = parser.parse_args()
 
+    import pandas as pd
+
     handler = ShellHandler(args.host)
     manager = get_workload_manager(handler)
     queued = manager.get_jobs()
@@ -5,9 +5,6 @@ import os
 import time
 import warnings
 
-import daemon
-from apscheduler.schedulers.blocking import BlockingScheduler
-
 from schedtools.jobs import rerun_jobs
 from schedtools.log import loggers
 from schedtools.service import make_service
@@ -92,6 +89,10 @@ def rerun():
         # Hand over to service, so we don't need to run the rest now.
         return
 
+    # Only needed when running the scheduler, so skipped for `--help` and `--service`
+    import daemon
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
     logger = loggers.current
     scheduler = BlockingScheduler()
 
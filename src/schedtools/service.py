@@ -1,8 +1,10 @@
 import os
 import subprocess
 import sys
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_service_file(name):
     name = name.lower().replace(" ", "-")
     return f"/etc/systemd/system/{name}.service"
@@ -1,14 +1,18 @@
 import re
 import subprocess
 from collections import namedtuple
-from typing import Union
-
-import paramiko
+from typing import TYPE_CHECKING, Union
 
 from schedtools.utils import connect_to_host
 
+if TYPE_CHECKING:
+    import paramiko
+
 SSHResult = namedtuple("SSHResult", ["stdin", "stdout", "stderr", "returncode"])
 
+# Terminal colouring and formatting escape sequences
+_ANSI_ESCAPE = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]")
+
 
 class CommandHandler:
     pass
@@ -41,7 +45,10 @@ class LocalHandler(CommandHandler):
 
 
 class ShellHandler(CommandHandler):
-    def __init__(self, ssh: Union[paramiko.SSHClient, str], **kwargs):
+    def __init__(self, ssh: Union["paramiko.SSHClient", str], **kwargs):
+        # Imported lazily, as paramiko is slow to import and not needed for local use
+        import paramiko
+
         if not isinstance(ssh, paramiko.SSHClient):
             ssh = connect_to_host(ssh, **kwargs)
         self.ssh = ssh
@@ -88,12 +95,13 @@ class ShellHandler(CommandHandler):
         sherr = []
         exit_status = 0
         for line in self.stdout:
-            if str(line).startswith(cmd) or str(line).startswith(echo_cmd):
+            line = str(line)
+            if line.startswith((cmd, echo_cmd)):
                 # up for now filled with shell junk from stdin
                 shout = []
-            elif str(line).startswith(finish):
+            elif line.startswith(finish):
                 # our finish command ends with the exit status
-                exit_status = int(str(line).rsplit(maxsplit=1)[1])
+                exit_status = int(line.rsplit(maxsplit=1)[1])
                 if exit_status:
                     # stderr is combined with stdout.
                     # thus, swap sherr with shout in a case of failure.
@@ -103,7 +111,7 @@ class ShellHandler(CommandHandler):
             else:
                 if unformat:
                     # get rid of 'coloring and formatting' special characters
-                    line = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]").sub("", line)
+                    line = _ANSI_ESCAPE.sub("", line)
                 shout.append(line.replace("\b", "").replace("\r", ""))
 
         # first and last lines of shout/sherr contain a prompt
@@ -6,9 +6,6 @@ import time
 from logging import Logger
 from typing import Any, Dict, Union
 
-import daemon
-from apscheduler.schedulers.blocking import BlockingScheduler
-
 from schedtools.log import loggers
 from schedtools.managers import get_workload_manager
 from schedtools.service import make_service
@@ -116,6 +113,10 @@ def storage_tracker():  # pragma: no cover
         # Hand over to service, so we don't need to run the rest now.
         return
 
+    # Only needed when running the scheduler, so skipped for `--help` and `--service`
+    import daemon
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
     logger = loggers.current
     scheduler = BlockingScheduler()
 
@@ -5,28 +5,68 @@ import subprocess
 import traceback
 import warnings
 from collections.abc import Iterable
-from functools import wraps
+from copy import deepcopy
+from functools import lru_cache, wraps
 from getpass import getpass
 
-import paramiko
 
+@lru_cache(maxsize=8)
+def _parse_ssh_config(path, mtime):
+    # `mtime` is only part of the cache key, so that edits to the file are picked up
+    import paramiko
 
-def connect_to_host(host_alias, get_password=False, **kwargs):
+    ssh = paramiko.SSHConfig()
+    with open(path) as f:
+        ssh.parse(f)
+    return ssh
+
+
+def load_ssh_config():
+    """Load the user's SSH config (`$SSH_CONFIG`, or `~/.ssh/config`).
+
+    The parsed config is cached until the file is modified.
+    """
+    user_config_file = os.environ.get("SSH_CONFIG", os.path.expanduser("~/.ssh/config"))
+    try:
+        mtime = os.stat(user_config_file).st_mtime_ns
+    except FileNotFoundError:
+        import paramiko
+
+        return paramiko.SSHConfig()
+    return _parse_ssh_config(user_config_file, mtime)
+
+
+@lru_cache(maxsize=32)
+def _lookup_host(ssh_config, host_alias):
+    return ssh_config.lookup(host_alias)
+
+
+def lookup_host(host_alias):
+    """Look up the SSH config for a host alias.
+
+    Results are cached for as long as the parsed SSH config is, since `lookup`
+    re-evaluates every matching rule in the config. A copy is returned, so callers may
+    modify it without affecting the cache.
+    """
+    return deepcopy(_lookup_host(load_ssh_config(), host_alias))
+
+
+def connect_to_host(host_alias, get_password=False, keepalive_interval=30, **kwargs):
     """Connect to an SSH host using an alias defined in `~/.ssh/config`.
 
     Args:
         host_alias: Alias for host to connect to.
+        get_password: Return the password used to authenticate (or None if no password
+            was needed) instead of the client, closing the connection. Defaults to False.
+        keepalive_interval: Seconds between SSH keepalive packets, which stop idle
+            connections from being dropped by firewalls or NAT. Pass 0 to disable.
+            Defaults to 30.
     """
-    if isinstance(host_alias, str):
-        ssh = paramiko.SSHConfig()
-        user_config_file = os.environ.get(
-            "SSH_CONFIG", os.path.expanduser("~/.ssh/config")
-        )
-        if os.path.exists(user_config_file):
-            with open(user_config_file) as f:
-                ssh.parse(f)
+    # Imported lazily, as paramiko is slow to import and CLIs only need it once connecting
+    import paramiko
 
-        host_config = ssh.lookup(host_alias)
+    if isinstance(host_alias, str):
+        host_config = lookup_host(host_alias)
     else:
         assert isinstance(host_alias, dict)
         host_config = host_alias
@@ -61,15 +101,19 @@ def connect_to_host(host_alias, get_password=False, **kwargs):
             look_for_keys=False,
         )
     if get_password:
+        # The connection was only needed to check authentication, so don't leave it open
+        ssh_client.close()
         return password
+    ssh_client.get_transport().set_keepalive(keepalive_interval)
     return ssh_client
 
 
 def walltime_to(walltime, period="h"):
     assert period in ["s", "m", "h"]
-    walltime = [int(el) for el in walltime.split(":")]
+    walltime = walltime.split(":")
     assert len(walltime) == 3
-    s = walltime[0] * 60 * 60 + walltime[1] * 60 + walltime[2]
+    hours, minutes, seconds = map(int, walltime)
+    s = hours * 3600 + minutes * 60 + seconds
     if period == "s":
         return s
     elif period == "m":
@@ -129,6 +129,8 @@ class DummyHandler(ShellHandler):
         qdel=True,
         data_threshold=False,
     ):
+        # Commands passed to `execute`, in call order
+        self.executed = []
         self.responses = {
             "qstat": SSHResult("", "", "", 0) if valid else SSHResult("", "", "", 1),
             "qstat -f": SSHResult("", dummy_queue, "", 0)
@@ -169,6 +171,7 @@ class DummyHandler(ShellHandler):
         ]
 
     def execute(self, command):
+        self.executed.append(command)
         if command in self.responses:
             return self.responses[command]
         for k, v in self.responses_in.items():
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from schedtools.clear_logs import clear_cluster_logs
+from schedtools.clear_logs import _PATTERNS, _find_cluster_logs, clear_cluster_logs
 
 
 @pytest.mark.parametrize("pattern", ["pbs", "slurm"])
@@ -38,3 +38,38 @@ def test_clear_cluster_logs(pattern, recursive, to_destroy):
             assert os.path.exists(os.path.join(check_dir, file)) == should_exist, (
                 os.path.join(check_dir, file) + f" should_exist {should_exist}"
             )
+
+
+@pytest.mark.parametrize("response", ["y", "n"])
+def test_clear_cluster_logs_prompt(response, monkeypatch, tmp_path):
+    files = [tmp_path / "dummylog.pbs.o1234", tmp_path / "dummylog.pbs.e1234"]
+    for file in files:
+        file.touch()
+    prompts = []
+
+    def dummy_input(prompt):
+        prompts.append(prompt)
+        return response
+
+    monkeypatch.setattr("builtins.input", dummy_input)
+    clear_cluster_logs(str(tmp_path), 5000, pattern="pbs")
+    # All matching files are confirmed with a single prompt
+    assert len(prompts) == 1
+    for file in files:
+        assert file.exists() == (response != "y")
+
+
+@pytest.mark.parametrize(
+    "recursive,cleared_depth", [(False, 0), (True, 1), (2, 2), (-1, 3)]
+)
+def test_find_cluster_logs_depth(recursive, cleared_depth, tmp_path):
+    dirs = [tmp_path]
+    for name in ["a", "b", "c"]:
+        dirs.append(dirs[-1] / name)
+        dirs[-1].mkdir()
+    files = [dir_ / f"dummylog.pbs.o{1000 + i}" for i, dir_ in enumerate(dirs)]
+    for file in files:
+        file.touch()
+
+    found = _find_cluster_logs(str(tmp_path), 5000, _PATTERNS["pbs"], recursive)
+    assert found == sorted(str(file) for file in files[: cleared_depth + 1])
@@ -46,3 +46,27 @@ def test_queue_priority_inference():
         last_priority = job.priority
     assert queue.count("unsubmitted") == 1
     assert queue.count("queued") == 1
+
+
+def test_queue_iteration_after_update():
+    queue = Queue([PBSJob(id="low", Job_Name="low", priority=0)])
+    assert [job.id for job in queue] == ["low"]
+    queue.append(PBSJob(id="high", Job_Name="high", priority=2))
+    assert [job.id for job in queue] == ["high", "low"]
+    queue.pop("high")
+    assert [job.id for job in queue] == ["low"]
+
+
+def test_job_attribute_access():
+    job = PBSJob(id="1", Job_Name="job", project="a_project")
+    assert job.project == "a_project"
+    assert not hasattr(job, "not_a_field")
+
+
+def test_queue_get():
+    job = PBSJob(id="1", Job_Name="job")
+    queue = Queue([job])
+    assert queue.get("1") is job
+    assert queue.get(job) is job
+    assert queue.get("2") is None
+    assert "1" in queue and job in queue and "2" not in queue
@@ -5,6 +5,7 @@ import shutil
 import pytest
 
 from schedtools.core import PBSJob
+from schedtools.exceptions import JobDeletionError
 from schedtools.jobs import (
     RERUN_TRACKED_CACHE,
     RERUN_TRACKED_FILE,
@@ -14,7 +15,7 @@ from schedtools.jobs import (
     track_new_jobs,
 )
 from schedtools.managers import PBS
-from schedtools.shell_handler import LocalHandler
+from schedtools.shell_handler import LocalHandler, SSHResult
 
 if __package__ is None or __package__ == "":
     from dummy_handler import DummyHandler
@@ -126,3 +127,37 @@ def test_rerun(to_destroy, valid, jobs, tracked, rerun, memkill, wallkill, qsub)
     if jobs:
         assert "7013474" in cached
         assert "7013475" in cached
+
+
+@pytest.mark.parametrize("qdel", [False, True])
+def test_delete_jobs(qdel):
+    handler = DummyHandler(qdel=qdel)
+    manager = PBS(handler, logger=logging.getLogger(__name__))
+    jobs = manager.get_jobs()
+    handler.executed.clear()
+    if qdel:
+        manager.delete_jobs(jobs)
+    else:
+        with pytest.raises(JobDeletionError):
+            manager.delete_jobs(jobs)
+    # All jobs are deleted with a single command
+    assert handler.executed == ["qdel 7013474 7013475"]
+
+    handler.executed.clear()
+    manager.delete_jobs([])
+    assert handler.executed == []
+
+
+@pytest.mark.parametrize(
+    "log", ["", "PBS: job killed: mem", "PBS: job killed: walltime"]
+)
+def test_was_killed(log):
+    handler = DummyHandler()
+    manager = PBS(handler, logger=logging.getLogger(__name__))
+    job = PBSJob({"id": "70134", "Error_Path": "host:/home/user/job.pbs.e70134"})
+    handler.responses["tail /home/user/job.pbs.e70134"] = SSHResult("", log, "", 0)
+    assert manager.was_killed(job) == bool(log)
+    # Both kill reasons are checked against a single read of the error log
+    assert handler.executed == ["tail /home/user/job.pbs.e70134"]
+    assert manager.was_killed_mem(job) == log.endswith("mem")
+    assert manager.was_killed_walltime(job) == log.endswith("walltime")
@@ -0,0 +1,47 @@
+import os
+
+import paramiko
+
+from schedtools.utils import load_ssh_config, lookup_host
+
+
+def write_ssh_config(path, hostname, mtime_ns):
+    path.write_text(f"Host cluster\n    HostName {hostname}\n    User user\n")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_ssh_config_cache(tmp_path, monkeypatch):
+    config_path = tmp_path / "config"
+    monkeypatch.setenv("SSH_CONFIG", str(config_path))
+    write_ssh_config(config_path, "old.example.com", 1_000_000_000_000_000_000)
+
+    config = load_ssh_config()
+    assert load_ssh_config() is config
+    assert config.lookup("cluster")["hostname"] == "old.example.com"
+
+    # Edits to the file are picked up once its modification time changes
+    write_ssh_config(config_path, "new.example.com", 1_000_000_001_000_000_000)
+    assert load_ssh_config() is not config
+    assert load_ssh_config().lookup("cluster")["hostname"] == "new.example.com"
+
+
+def test_load_ssh_config_missing(tmp_path, monkeypatch):
+    monkeypatch.setenv("SSH_CONFIG", str(tmp_path / "missing"))
+    config = load_ssh_config()
+    assert isinstance(config, paramiko.SSHConfig)
+    assert config.get_hostnames() == set()
+
+
+def test_lookup_host(tmp_path, monkeypatch):
+    config_path = tmp_path / "config"
+    monkeypatch.setenv("SSH_CONFIG", str(config_path))
+    write_ssh_config(config_path, "old.example.com", 1_000_000_000_000_000_000)
+
+    host_config = lookup_host("cluster")
+    assert host_config["hostname"] == "old.example.com"
+    # Returned configs are copies, so modifying one does not affect later lookups
+    host_config["hostname"] = "modified.example.com"
+    assert lookup_host("cluster")["hostname"] == "old.example.com"
+
+    write_ssh_config(config_path, "new.example.com", 1_000_000_001_000_000_000)
+    assert lookup_host("cluster")["hostname"] == "new.example.com"